@@ -159,7 +159,7 @@ class Grid(PoseNode):
         c_min = np.clip(self.cell_floor(center - [radius, radius]), 0, self.resolution - 1)
         c_max = np.clip(self.cell_ceil(center + [radius, radius]), 0, self.resolution - 1)
 
-        r2 = radius**2
+        r2 = radius * radius
         for i in range(c_min[0], c_max[0]):
             for j in range(c_min[1], c_max[1]):
                 if not hitmask[j, i]:
@@ -22,7 +22,8 @@ class PoseNode:
     node_children : dict
         Map of name to PoseNode for each child of this node.
     pose : 1x3 array
-        Pose vector of this node with respect to parent frame.
+        Pose vector of this node with respect to parent frame. The stored array is 
+        read-only; assign a new pose vector to move the node.
     root_node : PoseNode
         Root of the tree
     transform_to_parent : 3x3 matrix
@@ -55,7 +56,11 @@ class PoseNode:
 
         self.node_parent = None        
         self.node_children = {}
-        self.pose = np.asarray(pose, dtype=float)
+        self._cached_ttp = None
+        self._cached_tfp = None
+        self._cached_ttw = None
+        self._cached_tfw = None
+        self.pose = pose
 
         if parent is not None:
             parent.add_node(self)
@@ -73,6 +78,7 @@ class PoseNode:
         if node.node_parent is not None:
             node.node_parent.remove_node(node)        
         node.node_parent = self
+        node._invalidate()
     
     def remove_node(self, node):
         """Remove child node.
@@ -83,6 +89,8 @@ class PoseNode:
             Node to be removed
         """
         del self.node_children[node.name]
+        node.node_parent = None
+        node._invalidate()
 
     def __getitem__(self, name):
         """Returns a child node by name.
@@ -108,6 +116,28 @@ class PoseNode:
             n = n.node_children[item]
         return n
 
+    def _invalidate(self):
+        """Drop cached world transforms of this node and all of its descendants."""
+        stack = [self]
+        while stack:
+            n = stack.pop()
+            n._cached_ttw = None
+            n._cached_tfw = None
+            stack.extend(n.node_children.values())
+
+    @property
+    def pose(self):
+        return self._pose
+
+    @pose.setter
+    def pose(self, pose):
+        p = np.array(pose, dtype=float)
+        p.flags.writeable = False
+        self._pose = p
+        self._cached_ttp = None
+        self._cached_tfp = None
+        self._invalidate()
+
     @property
     def root_node(self):
         n = self
@@ -116,26 +146,45 @@ class PoseNode:
         return n
 
     @property
-    def transform_to_parent(self):    
-        return transforms.transform_from_pose(self.pose)
+    def transform_to_parent(self):
+        if self._cached_ttp is None:
+            t = transforms.transform_from_pose(self.pose)
+            t.flags.writeable = False
+            self._cached_ttp = t
+        return self._cached_ttp
 
     @property
-    def transform_from_parent(self):        
-        return transforms.rigid_inverse(self.transform_to_parent)
+    def transform_from_parent(self):
+        if self._cached_tfp is None:
+            t = transforms.rigid_inverse(self.transform_to_parent)
+            t.flags.writeable = False
+            self._cached_tfp = t
+        return self._cached_tfp
 
     @property
     def transform_to_world(self):
-        t = self.transform_to_parent
-        n = self.node_parent
-        while n is not None:
-            t = np.dot(n.transform_to_parent, t)
-            n = n.node_parent
-        return t
+        if self._cached_ttw is None:
+            # Collect nodes up to the first ancestor with a valid cache, then
+            # compose top-down, populating the caches of all intermediate nodes.
+            chain = []
+            n = self
+            while n is not None and n._cached_ttw is None:
+                chain.append(n)
+                n = n.node_parent
+            t = np.eye(3) if n is None else n._cached_ttw
+            for n in reversed(chain):
+                t = np.matmul(t, n.transform_to_parent)
+                t.flags.writeable = False
+                n._cached_ttw = t
+        return self._cached_ttw
 
     @property
     def transform_from_world(self):
-        t = self.transform_to_world
-        return transforms.rigid_inverse(t)
+        if self._cached_tfw is None:
+            t = transforms.rigid_inverse(self.transform_to_world)
+            t.flags.writeable = False
+            self._cached_tfw = t
+        return self._cached_tfw
 
     def transform_to(self, target):
         """Returns the relative transformation between this node and `target` node."""
@@ -19,8 +19,10 @@ class XYRobot(PoseNode):
         e = np.expand_dims(np.random.randn(2), 1)
         e *= sigma
 
-        self.pose[0] += motion[0] + e[0]
-        self.pose[1] += motion[1] + e[1]
+        pose = np.array(self.pose)
+        pose[0] += motion[0] + e[0]
+        pose[1] += motion[1] + e[1]
+        self.pose = pose
 
 class XYPhiRobot(PoseNode):
     """A robot fully described by its position in x,y and heading phi.
@@ -69,9 +71,11 @@ class XYPhiRobot(PoseNode):
         e = np.random.randn(2)
         e *= sigma
 
-        phi = self.pose[2] + motion[0] + e[0]
-        self.pose[0] += math.cos(phi) * (motion[1] + e[1])
-        self.pose[1] += math.sin(phi) * (motion[1] + e[1])
-        self.pose[2] = phi
+        pose = np.array(self.pose)
+        phi = pose[2] + motion[0] + e[0]
+        pose[0] += math.cos(phi) * (motion[1] + e[1])
+        pose[1] += math.sin(phi) * (motion[1] + e[1])
+        pose[2] = phi
+        self.pose = pose
         
 
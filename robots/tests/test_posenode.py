@@ -36,3 +36,30 @@ def test_nestednodes():
 
     np.testing.assert_allclose(w['c0.c1'].transform_to_world, [[0, -1, 15],[1, 0, 15], [0,0,1]], atol=1e-4)
     np.testing.assert_allclose(c1.transform_to_world, [[0, -1, 15],[1, 0, 15], [0,0,1]], atol=1e-4)
+
+def test_cached_transforms_follow_pose_changes():
+    w = PoseNode()
+    c0 = PoseNode([10,10,0], name='c0', parent=w)
+    c1 = PoseNode([5, 5,0], name='c1', parent=c0)
+    np.testing.assert_allclose(c1.transform_to_world, [[1, 0, 15],[0, 1, 15], [0,0,1]])
+
+    c0.pose = [20, 20, 0]
+    np.testing.assert_allclose(c1.transform_to_world, [[1, 0, 25],[0, 1, 25], [0,0,1]])
+    np.testing.assert_allclose(c1.transform_from_world, [[1, 0, -25],[0, 1, -25], [0,0,1]])
+
+    w2 = PoseNode([1, 1, 0])
+    w2.add_node(c0)
+    np.testing.assert_allclose(c1.transform_to_world, [[1, 0, 26],[0, 1, 26], [0,0,1]])
+
+    w2.remove_node(c0)
+    w2.pose = [5, 5, 0]
+    assert c0.node_parent is None
+    np.testing.assert_allclose(c1.transform_to_world, [[1, 0, 25],[0, 1, 25], [0,0,1]])
+
+def test_deep_chain():
+    w = PoseNode()
+    n = w
+    for i in range(2000):
+        n = PoseNode([1, 0, 0], parent=n)
+    np.testing.assert_allclose(n.transform_to_world[:2, 2], [2000, 0])
+    np.testing.assert_allclose(n.transform_from_world[:2, 2], [-2000, 0])
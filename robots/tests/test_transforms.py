@@ -70,6 +70,17 @@ def test_rigid_inverse():
     i = transforms.rigid_inverse(m)
     np.testing.assert_allclose(np.dot(m, i), np.eye(3), atol=1e-4)
 
+    m = np.dot(transforms.transform_from_pose([10, -3, math.pi/3]), transforms.transform_from_pose([-2, 5, -1.2]))
+    m = np.dot(m, transforms.transform_from_pose([4, 1, 2.5]))
+    i = transforms.rigid_inverse(m)
+    np.testing.assert_allclose(np.dot(m, i), np.eye(3), atol=1e-4)
+    np.testing.assert_allclose(np.dot(i, m), np.eye(3), atol=1e-4)
+
+    # Reflections are orthonormal too
+    m = np.array([[1, 0, 3], [0, -1, 2], [0, 0, 1]], dtype=float)
+    i = transforms.rigid_inverse(m)
+    np.testing.assert_allclose(np.dot(m, i), np.eye(3), atol=1e-4)
+
 def test_pose_from_transform():
     m = transforms.transform_from_pose([10, 0, math.pi/2])
     p = transforms.pose_from_transform(m)
@@ -59,14 +59,15 @@ def rigid_inverse(m):
     3x3 matrix 
         Inverse of `m`
     """
-    t = m[:2, 2]
-    r = m[:2, :2].T
+    r00, r01, x = m[0, 0], m[0, 1], m[0, 2]
+    r10, r11, y = m[1, 0], m[1, 1], m[1, 2]
 
-    mnew = np.eye(3)
-    mnew[:2, :2] = r
-    mnew[:2, 2] = -np.dot(r, t)
-
-    return mnew
+    # Closed form of [R^T, -R^T t] for an orthonormal 2x2 block R.
+    return np.array((
+        r00, r10, -r00 * x - r10 * y,
+        r01, r11, -r01 * x - r11 * y,
+        0., 0., 1.
+    ), dtype=float).reshape(3, 3)
 
 def transform_from_pose(pose):
     """Returns the 3x3 transform associated with the 3x1 pose vector.
@@ -85,11 +86,12 @@ def transform_from_pose(pose):
     c = math.cos(pose[2])
     s = math.sin(pose[2])
 
-    return np.array([
-        [c, -s, pose[0]],
-        [s, c, pose[1]],
-        [0, 0., 1]
-    ])
+    # Building from a flat tuple avoids nested sequence parsing in np.array.
+    return np.array((
+        c, -s, pose[0],
+        s, c, pose[1],
+        0., 0., 1.
+    ), dtype=float).reshape(3, 3)
 
 def pose_from_transform(m):
     """Returns the 1x3 pose vector associated with the given transform matrix.